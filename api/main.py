@@ -9,7 +9,7 @@ from contextlib import asynccontextmanager
 from uuid import uuid4
 from fastapi import FastAPI, HTTPException, Depends, Request, Query
 from fastapi.exceptions import RequestValidationError, ValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from shared.database_client import DatabaseClient
 
@@ -23,10 +23,13 @@ from api.models.responses import (
 
 # Load configs
 config = configparser.ConfigParser()
-config.read_file(open("/app/config/server.conf"))
+with open("/app/config/server.conf") as config_file:
+    config.read_file(config_file)
 use_database = config.getboolean("Database", "use_database")
 db_table_name = config["Database"]["db_table_name"]
 database_host = config["Database"]["host"]
+database_max_retries = config.getint("Database", "max_retries", fallback=3)
+application_name = config["TranspilerNode"]["application"]
 
 # Setup Logger
 is_slack_enabled = config.getboolean("Logger", "slack_logging_enabled")
@@ -41,9 +44,17 @@ redis_port = config["Redis"]["port"]
 transpiler_req_topic = config["Redis"]["transpiler_req"]
 ttl_seconds = config["Redis"]["ttl_seconds"]
 
+# The waiting status message is the same for every request, serialize it once
+waiting_status_message = json.dumps({"status": StatusEnum.waiting})
+
 
 redis = Redis()
 
+# One database client per process, so its session keeps reusing connections
+database_client = (
+    DatabaseClient(database_host, database_max_retries) if use_database else None
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -103,8 +114,20 @@ def healthcheck():
     """
     logger.info("()")
     logger.info("- Return status OK")
-    application = config["TranspilerNode"]["application"]
-    return HealthCheckResponse(status="OK", application=application)
+    return HealthCheckResponse(status="OK", application=application_name)
+
+
+@app.head("/healthcheck", include_in_schema=False)
+def healthcheck_head():
+    """Check the health of the application, without a response body.
+
+    Kept out of the schema so it does not duplicate the GET operation id.
+    Returns:
+        Response: An empty response with status 200.
+    """
+    logger.info("()")
+    logger.info("- Return status OK")
+    return Response(status_code=200)
 
 
 @app.post("/transpile", response_model=TranspilerResponse)
@@ -136,14 +159,12 @@ async def post_transpile(request: TranspilerRequest):
         redis.rpush(transpiler_req_topic, message.json())
 
         # Update waiting status to get_request topic
-        status_message = json.dumps({"status": StatusEnum.waiting})
-        redis.rpush(request_id, status_message)
+        redis.rpush(request_id, waiting_status_message)
 
         if use_database:
             logger.info(f"Creating database entry with id: {request_id}")
             try:
                 # Create entry in Database
-                database_client = DatabaseClient(database_host)
                 post_body = {"entry": {"status": StatusEnum.waiting},"entry_id": request_id, "table": db_table_name}
                 logger.debug(f"Post body: {post_body}")
 
@@ -187,7 +208,6 @@ async def get_transpiled_circuit(request_id: str):
             logger.info(f"Reading database entry with id: {request_id}")
             try:
                 # Read database entry
-                database_client = DatabaseClient(database_host)
                 get_response = database_client.get_request(request_id, db_table_name)
             except Exception as e:
                 err_msg = f"Failed to get entry in database: {e}"
@@ -201,7 +221,7 @@ async def get_transpiled_circuit(request_id: str):
                     status_code=404,
                     detail=err_msg,
                 )
-            msg_dict = json.loads(get_response.content)
+            msg_dict = get_response.json()
 
         else:
             err_msg = f"Invalid request id: {request_id}."
@@ -214,7 +234,7 @@ async def get_transpiled_circuit(request_id: str):
         try:
             # Peek at the first element in topic
             msg = redis.lindex(topic, 0)
-            msg_dict = json.loads(msg.decode())
+            msg_dict = json.loads(msg)
         except Exception as e:
             error_msg = f"Internal Error + {e}"
             logger.error(error_msg)
@@ -52,12 +52,6 @@ def get_logging_config(
                 "maxBytes": 100000,
                 "backupCount": 20,
             },
-            "slack": {
-                "formatter": "formatter",
-                "class": "logger.slack_logger.SlackHandler",
-                "slack_webhook_id": slack_webhook_id,
-                "level": "ERROR",
-            },
         },
         "formatters": {
             "formatter": {
@@ -69,6 +63,14 @@ def get_logging_config(
     }
 
     if slack_enabled:
+        # dictConfig builds every declared handler, only declare the slack one
+        # when it is used so logger.slack_logger and requests are not imported
+        LOGGING_CONFIG["handlers"]["slack"] = {
+            "formatter": "formatter",
+            "class": "logger.slack_logger.SlackHandler",
+            "slack_webhook_id": slack_webhook_id,
+            "level": "ERROR",
+        }
         LOGGING_CONFIG["loggers"][""]["handlers"].append("slack")
 
     return LOGGING_CONFIG
@@ -17,10 +17,13 @@ class RedisHandler(logging.Handler):
 
     def emit(self, record):
         log_message = self.format(record)
-        self.redis_client.rpush(self.redis_topic, log_message)
 
-        # Get the current time to live of the redis topic
-        current_ttl = self.redis_client.ttl(self.redis_topic)
+        # Push the log and get the current time to live of the redis topic
+        # in a single round trip
+        pipeline = self.redis_client.pipeline(transaction=False)
+        pipeline.rpush(self.redis_topic, log_message)
+        pipeline.ttl(self.redis_topic)
+        _, current_ttl = pipeline.execute()
         if current_ttl == -1:
             # The key does not have a time to live
             if self.ttl_seconds is not None:
@@ -9,9 +9,13 @@ class SlackHandler(StreamHandler):
         StreamHandler.__init__(self)
         self.slack_webhook_id = slack_webhook_id
         self._webhook_url_base = "https://hooks.slack.com/services/"
+        # get_logging_config() defaults the webhook id to None, only build the
+        # url when there is an id so the handler can still be created
+        self._webhook_url = None
+        if slack_webhook_id is not None:
+            self._webhook_url = self._webhook_url_base + slack_webhook_id
 
     def emit(self, record):
         msg = {"text": self.format(record)}
         payload = json.dumps(msg)
-        webhook_url = self._webhook_url_base + self.slack_webhook_id
-        requests.post(webhook_url, payload)
+        requests.post(self._webhook_url, payload)
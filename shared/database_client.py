@@ -2,17 +2,34 @@ import logging
 import requests
 import json
 import configparser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 class DatabaseClient:
-    def __init__(self, host_url):
+    def __init__(self, host_url, max_retries=3):
         """
         Initialize the Database Manager.
 
         Args:
                 host_url (str): Host url to database.
+                max_retries (int): Number of retries on connection errors and
+                        transient gateway errors.
         """
         self.host_url = host_url
+        # Reuse pooled connections across requests and retry transient failures.
+        # Retry only replays idempotent methods on bad status codes, so a POST
+        # is never sent twice after the server has seen it.
+        retries = Retry(
+            total=max_retries,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+        )
+        self.session = requests.Session()
+        self.session.mount(host_url, HTTPAdapter(max_retries=retries))
+        # Endpoints that do not depend on the request are built only once
+        self.create_endpoint = host_url + "create"
+        self.update_endpoint = host_url + "update"
 
     def get_request(self, request_id, table, headers=None):
         """
@@ -27,7 +44,7 @@ class DatabaseClient:
         # Construct api endpoint
         api_endpoint = self.host_url + "read/" + request_id + "/" + table
         logger.debug(f"api_endpoint: {api_endpoint}")
-        response = requests.get(
+        response = self.session.get(
             api_endpoint, headers=headers, verify=True,
         )
 
@@ -43,9 +60,9 @@ class DatabaseClient:
         logger.debug("POST Request")
 
         # Construct api endpoint
-        api_endpoint = self.host_url + "create" 
+        api_endpoint = self.create_endpoint
         logger.debug(f"api_endpoint: {api_endpoint}")
-        response = requests.post(
+        response = self.session.post(
             api_endpoint,
             headers=headers,
             verify=True,
@@ -64,9 +81,9 @@ class DatabaseClient:
         logger.debug("PUT Request")
 
         # Construct api endpoint
-        api_endpoint = self.host_url + "update"
+        api_endpoint = self.update_endpoint
         logger.debug(f"api_endpoint: {api_endpoint}")
-        response = requests.put(
+        response = self.session.put(
             api_endpoint,
             headers=headers,
             verify=True,
@@ -4,7 +4,8 @@ import configparser
 
 # Load configs
 config = configparser.ConfigParser()
-config.read_file(open('config/server.conf'))
+with open('config/server.conf') as config_file:
+    config.read_file(config_file)
 log_level = config['Logger']['log_level']
 log_file = config['Logger']['log_file']
 
@@ -18,13 +18,19 @@ from utils import parse
 logging.config.dictConfig(get_logging_config())
 logger = logging.getLogger(__name__)
 
+# Accepted spellings of the boolean command line arguments
+BOOL_STRINGS = frozenset(("true", "false"))
+
+# Parser class to use for each supported input language
+PARSER_BY_LANGUAGE = {"qasm": parse.ParseQasm, "projectq": parse.ParseProjectQ}
+
 
 def is_bool(value: str) -> bool:
     """Checks if the input is a string representing a boolean value"""
     logger.info(f"value={value}")
 
     value = value.lower()
-    if value not in ["true", "false"]:
+    if value not in BOOL_STRINGS:
         message = "Argument entered is invalid. " "Please enter either True or False."
         logger.error(message)
         raise argparse.ArgumentTypeError(message)
@@ -240,13 +246,15 @@ def writeToFile(circuit: list, file: str, cfg: dict, step: str) -> None:
             + ".txt"
         )
 
+    # Render the whole circuit once, so each attempt is a single write
+    circuit_text = "".join(str(line) + "\n" for line in circuit)
+
     for i in range(5):
         try:
             with open(
                 output_name, ("w" if cfg["language"] == "qasm" else "a")
             ) as output_file:
-                for line in circuit:
-                    output_file.writelines(str(line) + "\n")
+                output_file.write(circuit_text)
             logger.info(f"Successfully wrote to {output_name} on attempt {i+1}")
             return output_name
         except (FileNotFoundError, PermissionError) as e:
@@ -371,8 +379,7 @@ def get_parser_and_circuit_input(cfg: dict):
     """
     logger.info(f"cfg={cfg}")
 
-    parser_dict = {"qasm": parse.ParseQasm, "projectq": parse.ParseProjectQ}
-    chosen_parser = parser_dict[cfg["language"]]
+    chosen_parser = PARSER_BY_LANGUAGE[cfg["language"]]
     circuit_input: str = cfg["input"]
 
     logger.info(f"chosen_parser={chosen_parser}")
@@ -4,7 +4,6 @@ from .Rotation import Rotation
 from .Measure import Measure
 import os
 import subprocess
-from time import sleep
 
 import logging.config
 
@@ -34,11 +33,23 @@ class LysCompiler:
         "z": ["z", pi / 2],
         "y": ["y", pi / 2],
     }
-    rotation_gates = [
+    rotation_gates = {
         "rz",
         "ry",
         "rx",
-    ]  # We do not process rotation gates. Throw an exception if encounters one.
+    }  # We do not process rotation gates. Throw an exception if encounters one.
+
+    # Encoding of the rotation angles (with phase) as signed integers, and back.
+    # Angles are rounded to 8 decimals before being encoded.
+    angle_decoding = {0: pi / 2, 2: pi / 4, -2: -pi / 4, 1: pi / 8, -1: -pi / 8}
+    angle_encoding = {
+        round(-pi / 2, 8): 0,
+        round(pi / 2, 8): 0,
+        round(pi / 4, 8): 2,
+        round(-pi / 4, 8): -2,
+        round(pi / 8, 8): 1,
+        round(-pi / 8, 8): -1,
+    }
 
     def __init__(
         self,
@@ -83,10 +94,8 @@ class LysCompiler:
                 self.update_cpp_num_qubits()
                 or make_new_cpp is True
                 or not all(
-                    [
-                        os.path.isfile(required_file_path)
-                        for required_file_path in list_of_required_cpp_files
-                    ]
+                    os.path.isfile(required_file_path)
+                    for required_file_path in list_of_required_cpp_files
                 )
             ):
                 logger.info(
@@ -100,13 +109,10 @@ class LysCompiler:
                     stderr=subprocess.STDOUT,
                     cwd="src/cpp_compiler/",
                 )
-                exit_code = make_process.returncode
-                poll = make_process.poll()
-
                 logger.info("This process might take a while. Please wait.")
-                while poll == None:
-                    sleep(1)
-                    poll = make_process.poll()
+                # Wait for make to finish while draining its output, so it can
+                # not block on a full pipe
+                make_process.communicate()
 
                 exit_code = make_process.returncode
                 if exit_code:
@@ -190,7 +196,7 @@ class LysCompiler:
                 translated.append(
                     (each_gate[0], each_gate[1])
                 )  # if gate is measure, directly add to the translated list
-            elif gate_name in self.gate_def.keys():
+            elif gate_name in self.gate_def:
                 # Apply the translation rules defined in gate_def and replace the original gates with the translation
                 translated.append((self.gate_def[gate_name], each_gate[1]))
             elif gate_name in self.rotation_gates:
@@ -254,9 +260,9 @@ class LysCompiler:
         """
         logger.trace(f"angle={angle}")
 
-        angle_decoding = {0: pi / 2, 2: pi / 4, -2: -pi / 4, 1: pi / 8, -1: -pi / 8}
+        angle_decoding = LysCompiler.angle_decoding
 
-        if angle not in angle_decoding.keys():
+        if angle not in angle_decoding:
             error_msg = "Unknown encoded angle"
             logger.error(error_msg)
             raise ValueError(error_msg)
@@ -280,25 +286,19 @@ class LysCompiler:
         """
         logger.trace(f"angle={angle}")
 
-        angle_encoding = {
-            round(-pi / 2, 8): 0,
-            round(pi / 2, 8): 0,
-            round(pi / 4, 8): 2,
-            round(-pi / 4, 8): -2,
-            round(pi / 8, 8): 1,
-            round(-pi / 8, 8): -1,
-        }
+        angle_encoding = LysCompiler.angle_encoding
+        rounded_angle = round(angle, 8)
 
-        if round(angle, 8) not in angle_encoding.keys():
+        if rounded_angle not in angle_encoding:
             error_msg = "Unknown angle"
             logger.error(error_msg)
             raise ValueError(error_msg)
         else:
             logger.trace(
-                f"angle_encoding[round(angle, 8)]={angle_encoding[round(angle, 8)]}"
+                f"angle_encoding[round(angle, 8)]={angle_encoding[rounded_angle]}"
             )
             logger.trace("- Return")
-            return angle_encoding[round(angle, 8)]
+            return angle_encoding[rounded_angle]
 
     def _transform_to_operation_objects(
         self, num_qubits: int, decomposed_gates: list
@@ -328,7 +328,7 @@ class LysCompiler:
 
             else:
                 if len(gate[1]) > 1:  # Case of ZX rotation (part of pre-decomposed CX)
-                    basis = [gate[0][i][0] for i in range(len(gate[0]))]
+                    basis = [rotation[0] for rotation in gate[0]]
                     qubit = gate[1]
                     angle = gate[0][0][1]
                     angled_encoded = self.encode_angle(angle)
@@ -366,11 +366,11 @@ class LysCompiler:
         """
         logger.info("_add_measure()")
 
-        # Check if the last elements are measures
-        for i in range(-num_qubits, 0):
-            if not isinstance(pauli_operators[i], Measure):
-                add_measures = True
-                break
+        # Check if the last elements are measures, stopping at the first one
+        # that is not
+        add_measures = any(
+            not isinstance(pauli_operators[i], Measure) for i in range(-num_qubits, 0)
+        )
 
         if add_measures:
             for qubit in range(num_qubits):
@@ -440,14 +440,14 @@ class LysCompiler:
         logger.trace("()")
 
         python_transpiled_circuit = []
+        num_qubits = self.num_qubits
+        return_rotation_basis_string = self.runLysCompiler.return_rotation_basis_string
         for gate in transpiled_circuit:
             python_gate = Rotation(0, 0, [], [])
-            python_gate.n = self.num_qubits
+            python_gate.n = num_qubits
             python_gate.angle = gate.angle
 
-            gate_bitset_string_tuple = self.runLysCompiler.return_rotation_basis_string(
-                gate
-            )
+            gate_bitset_string_tuple = return_rotation_basis_string(gate)
             python_gate.x = int(gate_bitset_string_tuple[0], 2)
             python_gate.z = int(gate_bitset_string_tuple[1], 2)
 
@@ -469,14 +469,14 @@ class LysCompiler:
         logger.trace("()")
 
         python_transpiled_circuit = []
+        num_qubits = self.num_qubits
+        return_measure_basis_string = self.runLysCompiler.return_measure_basis_string
         for gate in transpiled_measure:
             python_gate = Measure(0, 0, [], [])
-            python_gate.n = self.num_qubits
+            python_gate.n = num_qubits
             python_gate.phase = gate.phase
 
-            gate_bitset_string_tuple = self.runLysCompiler.return_measure_basis_string(
-                gate
-            )
+            gate_bitset_string_tuple = return_measure_basis_string(gate)
 
             python_gate.x = int(gate_bitset_string_tuple[0], 2)
             python_gate.z = int(gate_bitset_string_tuple[1], 2)
@@ -527,23 +527,29 @@ class LysCompiler:
         rotation_index_py = []
         measure_index_py = []
 
+        # Bind the lookups used for every gate to locals once
+        cpp_rotation = self.runLysCompiler.Rotation
+        cpp_measure = self.runLysCompiler.Measure
+        # Zero padded binary string of num_qubits digits
+        bitset_format = f"0{self.num_qubits}b"
+
         for i, gate in enumerate(gate_list):
             if isinstance(gate, Rotation):
                 rotation_cpp.append(
-                    self.runLysCompiler.Rotation(
+                    cpp_rotation(
                         gate.angle,
-                        bin(gate.x)[2:].zfill(self.num_qubits),
-                        bin(gate.z)[2:].zfill(self.num_qubits),
+                        format(gate.x, bitset_format),
+                        format(gate.z, bitset_format),
                     )
                 )
                 rotation_index_py.append(i)
 
             elif isinstance(gate, Measure):
                 measure_cpp.append(
-                    self.runLysCompiler.Measure(
+                    cpp_measure(
                         gate.phase,
-                        bin(gate.x)[2:].zfill(self.num_qubits),
-                        bin(gate.z)[2:].zfill(self.num_qubits),
+                        format(gate.x, bitset_format),
+                        format(gate.z, bitset_format),
                     )
                 )
                 measure_index_py.append(i)
@@ -660,15 +666,19 @@ class LysCompiler:
         logger.info("()")
 
         total = len(rot_ind) + len(mea_ind)
+        # Position of each circuit index within rot_ind / mea_ind, so every
+        # lookup is constant time instead of a scan of the index vectors
+        rot_position = {index: j for j, index in enumerate(rot_ind)}
+        mea_position = {index: j for j, index in enumerate(mea_ind)}
         result = []
         for i in range(total):
-            if i in rot_ind:
-                j = rot_ind.index(i)
+            if i in rot_position:
+                j = rot_position[i]
                 rotation_py = self.transform_to_python_rotation([rot_cpp[j]])
                 result.extend(rotation_py)
             else:
                 # this item is a measure
-                j = mea_ind.index(i)
+                j = mea_position[i]
                 measure_py = self.transform_to_python_measure([mea_cpp[j]])
                 result.extend(measure_py)
 
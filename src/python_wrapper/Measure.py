@@ -1,6 +1,8 @@
 from .Operation import Operation
 
 class Measure(Operation):
+    __slots__ = ('phase',)
+
     def __init__(self, num_qubits: int, phase: bool, basis: list=[], qubits: list=[]):
         """Constructor, makes the Measure object.
 
@@ -29,19 +31,10 @@ class Measure(Operation):
         Returns:
             str: String representation of the Measure.
         """
-        measure_str = ''
-        qubits = ''
         phase  = '-'
         if (self.phase == 1): phase = '+'
-        x = bin(self.x)[2:].zfill(self.n)
-        z = bin(self.z)[2:].zfill(self.n)
-        for i in range(0,self.n):
-            if (int(x[i])==1) & (int(z[i])==0):     measure_str += 'X'
-            elif (int(x[i])==0) & (int(z[i])==1):   measure_str += 'Z'
-            elif (int(x[i])==1) & (int(z[i])==1):   measure_str += 'Y'
-            else:                         measure_str += 'I'
 
-        return "Measure " + phase + ": " + measure_str
+        return "Measure " + phase + ": " + self.pauli_string()
 
     def __eq__(self, other) -> bool:
         """Boolean comparator method for independant measure. 
@@ -1,4 +1,10 @@
+# Pauli operator on one qubit, keyed by its (x, z) tableau bits
+PAULI_FROM_XZ_BITS = {('0', '0'): 'I', ('1', '0'): 'X', ('0', '1'): 'Z', ('1', '1'): 'Y'}
+
 class Operation():
+    # Gates are created per circuit line, keep the instances small
+    __slots__ = ('n', 'x', 'z')
+
     def __init__(self, num_qubits: int, basis:list =[] , qubits:list =[]):
         """Constructor, makes the Operation object.
 
@@ -18,16 +24,23 @@ class Operation():
         if len(basis) != len(set(qubits)):
             raise ValueError("Illegal declaration. Number of basis and number of qubits must be equal and the qubits must be unique")
         if basis != []:
+            # accumulate in locals, the attributes are only set once at the end
+            x = 0
+            z = 0
             for index, val in enumerate(basis):
+                # bit of the qubit in the x/z integers, qubit 0 is the left most bit
+                bit = 1 << (num_qubits-1-int(qubits[index]))
                 if val == 'x':
-                    self.x += 2**(num_qubits-1-int(qubits[index]))
+                    x += bit
                 elif val == 'z':
-                    self.z += 2**(num_qubits-1-int(qubits[index]))
+                    z += bit
                 elif val == 'y':
-                    self.x += 2**(num_qubits-1-int(qubits[index]))
-                    self.z += 2**(num_qubits-1-int(qubits[index]))
+                    x += bit
+                    z += bit
                 else:
                     raise ValueError("Unknown basis")
+            self.x = x
+            self.z = z
 
     def __repr__(self):
         """Returns printable representation.
@@ -66,5 +79,13 @@ class Operation():
         if bin(xOrz).count('1')==1 :
             return True
         return False
-    
-    
\ No newline at end of file
+
+    def pauli_string(self) -> str:
+        '''This method returns the Pauli string of the operation, qubit 0 first
+
+        Returns:
+            str: One of 'I', 'X', 'Y', 'Z' per qubit, e.g. 'XIZ'
+        '''
+        x = bin(self.x)[2:].zfill(self.n)
+        z = bin(self.z)[2:].zfill(self.n)
+        return ''.join([PAULI_FROM_XZ_BITS[bits] for bits in zip(x[:self.n], z[:self.n])])
@@ -23,6 +23,7 @@ class Rotation(Operation):
     Convention:
         Left most position is qubit 0; right most position is qubit n
     '''
+    __slots__ = ('angle',)
 
     def __init__(self, num_qubits: int, angle: int, basis:list =[] , qubits:list =[]):
         """Constructor, makes the rotation object.
@@ -52,18 +53,7 @@ class Rotation(Operation):
         Returns:
             str: String representation of the Rotation
         """
-        rotation_str = ''
-        qubits = ''
-        angle  = str(self.angle)
-        x = bin(self.x)[2:].zfill(self.n)
-        z = bin(self.z)[2:].zfill(self.n)
-        for i in range(0,self.n):
-            if (int(x[i])==1) & (int(z[i])==0):     rotation_str += 'X'
-            elif (int(x[i])==0) & (int(z[i])==1):   rotation_str += 'Z'
-            elif (int(x[i])==1) & (int(z[i])==1):   rotation_str += 'Y'
-            else:                         rotation_str += 'I'
-
-        return "Rotate " + angle + ": " + rotation_str
+        return "Rotate " + str(self.angle) + ": " + self.pauli_string()
 
     def __eq__(self, other) -> bool:
         """Boolean comparator method for independant rotations. 
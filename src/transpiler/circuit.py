@@ -4,6 +4,8 @@ sequence of Pi8 rotations, Pi4 rotations and measurements.
 
 from __future__ import annotations
 import dataclasses
+from collections import Counter
+from functools import cached_property
 
 from src.transpiler.rotation import (
     Rotation,
@@ -28,27 +30,33 @@ class Circuit:
             circuit_dir=circuit_dir, split_y=False
         )
 
+    @cached_property
+    def _operation_type_counts(self) -> Counter:
+        """Number of rotations of each operation type, counted once on first access"""
+        return Counter(r.operation_type for r in self.rotations)
+
     @property
     def total_operations(self):
         """Total number of operations in the circuit"""
-        return self.pi8 + self.pi4 + self.measurements + self.turns
+        counts = self._operation_type_counts
+        return counts[PI8] + counts[PI4] + counts[MEASUREMENT] + counts[TURN]
 
     @property
     def pi8(self) -> int:
         """Number of PI8 rotations in the circuit"""
-        return len({r.ind for r in self.rotations if r.operation_type == PI8})
+        return self._operation_type_counts[PI8]
 
     @property
     def pi4(self) -> int:
         """Number of PI4 rotations in the circuit"""
-        return len({r.ind for r in self.rotations if r.operation_type == PI4})
+        return self._operation_type_counts[PI4]
 
     @property
     def measurements(self) -> int:
         """Number of measurements in the circuit (must be equal to num_qubits)"""
-        return len({r.ind for r in self.rotations if r.operation_type == MEASUREMENT})
+        return self._operation_type_counts[MEASUREMENT]
 
     @property
     def turns(self) -> int:
         """Number of measurements in the circuit (must be equal to num_qubits)"""
-        return len({r.ind for r in self.rotations if r.operation_type == TURN})
+        return self._operation_type_counts[TURN]
@@ -34,11 +34,18 @@ measure = literal_measure whitespace sign          whitespace colon whitespace p
 """
 #         0               1          2             3          4     5          6      7
 
+# Building the grammar parses the rules above, do it once rather than per file
+ROTATION_GRAMMAR = Grammar(GRAMMAR)
+
 
 @dataclasses.dataclass(frozen=False)
 class Rotation:
     """For a single rotation"""
 
+    # One instance per rotation in the circuit, slots keep them small.
+    # dataclass(slots=True) needs python 3.10, so they are listed by hand
+    __slots__ = ("ind", "operation_type", "operation_sign", "x", "y", "z")
+
     ind: int  # Index of the rotation in the original circuit
     operation_type: RotationType  # Pi8, Pi4, or Measurement
     operation_sign: Literal["+", "-"]
@@ -102,7 +109,7 @@ def parse_rotations(circuit_dir: str, split_y: bool) -> tuple[list[Rotation], in
         a list of rotations, the number of qubits, and the name of the circuit
     """
 
-    gr = Grammar(GRAMMAR)
+    gr = ROTATION_GRAMMAR
 
     rotations: list[Rotation] = []
 
@@ -42,7 +42,9 @@ def create_runtime_plot_data(num_lines_runtime_dict):
         xy_list_pair = [x_list, y_list]
         processed_results[function_name] = xy_list_pair
     
-    save_json_file = "data/output/py_cpp_runtimes/runtime_dict.json"
+    save_json_dir = "data/output/py_cpp_runtimes/"
+    os.makedirs(save_json_dir, exist_ok=True)
+    save_json_file = save_json_dir + "runtime_dict.json"
     with open(save_json_file, 'w') as out_file:
         json.dump(processed_results, out_file)
         
@@ -85,7 +87,8 @@ def plot_runtimes(processed_results):
         plt.draw()
         save_plot_file = "data/output/py_cpp_runtimes/" + plot_title + ".png"
         plt.savefig(save_plot_file)
-        fig.clf()
+        # clf() only empties the figure, close it so pyplot releases it
+        plt.close(fig)
 
 if __name__== '__main__':
     runtime_test_qasm_files = [str("data/input/data_stats_test_folder/" + str(f)) for f in listdir("data/input/data_stats_test_folder/") if isfile(join("data/input/data_stats_test_folder/", f))]
@@ -0,0 +1,25 @@
+from fastapi.testclient import TestClient
+from api.main import app
+
+client = TestClient(app)
+
+
+def test_healthcheck_get():
+    response = client.get("/healthcheck")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "OK"
+
+
+def test_healthcheck_head():
+    response = client.head("/healthcheck")
+
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+def test_healthcheck_openapi_single_operation():
+    # The HEAD route is kept out of the schema, so operation ids stay unique
+    paths = client.get("/openapi.json").json()["paths"]
+
+    assert list(paths["/healthcheck"].keys()) == ["get"]
@@ -0,0 +1,32 @@
+from src.python_wrapper.LysCompiler_cpp_interface import LysCompiler
+from src.python_wrapper.Rotation import Rotation
+from src.python_wrapper.Measure import Measure
+import pytest
+
+@pytest.fixture
+def compiler():
+    return LysCompiler([], 0, pytest_mode=True)
+
+
+def test_add_measure_already_measured(compiler):
+    # No rotation among the last gates, nothing should be added
+    circuit = [
+        Rotation(2,1,['x'],[0]),
+        Measure(2,True,['z'],[0]),
+        Measure(2,True,['z'],[1]),
+    ]
+    expected = list(circuit)
+
+    result = compiler._LysCompiler__add_measure(2, circuit)
+    assert expected == result
+
+
+def test_add_measure_missing(compiler):
+    circuit  = [Rotation(2,1,['x'],[0]), Measure(2,True,['z'],[0])]
+    expected = list(circuit) + [
+        Measure(2,True,['z'],[0]),
+        Measure(2,True,['z'],[1]),
+    ]
+
+    result = compiler._LysCompiler__add_measure(2, circuit)
+    assert expected == result
@@ -42,4 +42,17 @@ def test_eq(ro):
         else:
             break
 
-    assert expected == results
\ No newline at end of file
+    assert expected == results
+
+
+def test_str(ro):
+    XYZ  = Rotation(3,1,['x','y','z'],[0,1,2])
+    ZIX  = Rotation(3,-2,['z','x'],[0,2])
+
+    cases    = [ro, XYZ, ZIX]
+    expected = ["Rotate 0: III", "Rotate 1: XYZ", "Rotate -2: ZIX"]
+    results  = []
+
+    for each in cases:
+        results.append(str(each))
+    assert expected == results
@@ -0,0 +1,56 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from shared.database_client import DatabaseClient
+
+
+class _UnavailableHandler(BaseHTTPRequestHandler):
+    """Answers every request with 503 and counts the requests per method"""
+
+    def _unavailable(self):
+        self.server.request_counts[self.command] += 1
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = _unavailable
+    do_POST = _unavailable
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def unavailable_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _UnavailableHandler)
+    server.request_counts = {"GET": 0, "POST": 0}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_request_retried_on_503(unavailable_server):
+    host_url = f"http://127.0.0.1:{unavailable_server.server_port}/"
+    database_client = DatabaseClient(host_url, max_retries=2)
+
+    with pytest.raises(requests.exceptions.RetryError):
+        database_client.get_request("request_id", "table")
+
+    # first attempt plus max_retries retries
+    assert unavailable_server.request_counts["GET"] == 3
+
+
+def test_post_request_not_retried(unavailable_server):
+    host_url = f"http://127.0.0.1:{unavailable_server.server_port}/"
+    database_client = DatabaseClient(host_url, max_retries=2)
+
+    # POST is not idempotent, it must be sent only once
+    response = database_client.post_request({"entry_id": "request_id"})
+
+    assert response.status_code == 503
+    assert unavailable_server.request_counts["POST"] == 1
@@ -149,6 +149,26 @@ def test_ParseQasm_qubit_renumbering_range(rel_path: str, n_qubits: int) -> None
     print(f"\n\ntest_ParseQasm_qubit_renumbering_range passed\n\n\n")
 
 
+# pylint: disable=invalid-name
+# noinspection PyPep8Naming
+@mark.parametrize(
+    "qubit_names,expected_encoded,expected_unique",
+    [
+        ([["q[0]"], ["q[2]"]], [[0], [1]], [0, 2]),
+        # digits in the register name must not be read as the index
+        ([["q2[3]", "q2[12]"]], [[0, 1]], [3, 12]),
+        ([["anc10[11]"], ["q1[3]", "anc10[11]"]], [[1], [0, 1]], [3, 11]),
+    ],
+)
+def test_ParseQasm_encode_qubit_name(
+    qubit_names: list, expected_encoded: list, expected_unique: list
+) -> None:
+    encoded, unique_qubits = m.ParseQasm.encode_qubit_name(qubit_names)
+
+    assert encoded == expected_encoded
+    assert unique_qubits == expected_unique
+
+
 # pylint: disable=line-too-long
 # if __name__ == '__main__': test_ParseQasm_qubit_renumbering_range("data/input/data_stats_test_folder/qasm_test_5_lines.qasm", 1)
 # if __name__ == '__main__': test_ParseQasm_qubit_renumbering_range("data/input/data_stats_test_folder/qasm_test_10_lines.qasm", 3)
@@ -271,3 +291,101 @@ def test_ParseProjectQ() -> None:
 
 
 # if __name__ == "__main__": test_projectq()
+
+
+class _FakeDecompose:
+    """Stands in for the gridsynth wrapper: rz(pi/2) -> S, anything else -> HT"""
+
+    def __init__(self, unitary, epsilon=1e-10) -> None:
+        self.unitary = unitary
+        self.operators = "S\n" if unitary == "rz(pi/2)" else "TH\n"
+
+
+@mark.parametrize("threshold", [1, 100])
+def test_perform_rz_decomposition(threshold: int, monkeypatch) -> None:
+    monkeypatch.setattr(m.decompose, "Decompose", _FakeDecompose)
+    parser = m.Parse(None, 1e-10)
+    parser.parallel_decomposition_threshold = threshold
+
+    gate_list = [
+        ("h", [0]),
+        ("rz(pi/2)", [1]),
+        ("cx", [0, 1]),
+        ("rz(0.3)", [0]),
+        ("rz(pi/2)", [0]),
+    ]
+
+    assert parser.perform_rz_decomposition(gate_list) == [
+        ("h", [0]),
+        ("s", [1]),
+        ("cx", [0, 1]),
+        ("h", [0]),
+        ("t", [0]),
+        ("s", [0]),
+    ]
+
+
+def test_ParseProjectQ_ancilla_reuse_lowest_free(tmp_path) -> None:
+    # qubits 0 and 1 are data qubits, 2, 3 and 4 are the ancilla spots.
+    # Re-allocated ancillas (5, 6 and 7) must take the lowest free spot,
+    # not the most recently freed one
+    circuit = tmp_path / "projectq_ancilla_reuse.txt"
+    circuit.write_text(
+        "\n".join(
+            [
+                "Allocate | Qureg[0]",
+                "Allocate | Qureg[1]",
+                "Allocate | Qureg[2]",
+                "Allocate | Qureg[3]",
+                "Allocate | Qureg[4]",
+                "Deallocate | Qureg[3]",
+                "Deallocate | Qureg[4]",
+                "Allocate | Qureg[5]",  # spots 3 and 4 are free, takes 3
+                "X | Qureg[5]",
+                "Allocate | Qureg[6]",  # takes 4
+                "H | Qureg[6]",
+                "Deallocate | Qureg[2]",
+                "Allocate | Qureg[7]",  # takes 2, freed after 3 and 4
+                "T | Qureg[7]",
+                "Deallocate | Qureg[5]",
+                "Deallocate | Qureg[6]",
+                "Deallocate | Qureg[7]",
+                "Measure | Qureg[0]",
+                "Measure | Qureg[1]",
+            ]
+        )
+        + "\n"
+    )
+
+    projectq_parser = m.ParseProjectQ(str(circuit))
+    expected_result = [
+        [("measure", [3]), ("measure", [4])],
+        [("x", [3]), ("h", [4]), ("measure", [2])],
+        [
+            ("t", [2]),
+            ("measure", [3]),
+            ("measure", [4]),
+            ("measure", [2]),
+            ("measure", [0]),
+            ("measure", [1]),
+        ],
+        [],
+    ]
+    assert expected_result == projectq_parser.break_into_sections()
+    assert projectq_parser.max_width == 5
+
+
+def test_ParseProjectQ_instructions_cached() -> None:
+    test_file = paths.get_abs_path_to_input_file(
+        "test_circuits/projectq_measure_anc_short.txt"
+    )
+    projectq_parser = m.ParseProjectQ(test_file)
+
+    # reading instructions again must not re-parse the file,
+    # which would add to gate_count a second time
+    first = projectq_parser.instructions
+    assert projectq_parser.gate_count == 18
+    second = projectq_parser.instructions
+    assert projectq_parser.gate_count == 18
+    assert first == second
+    assert first is second
@@ -1,17 +1,29 @@
+# Gates whose whole name maps to a QBASE name, looked up with a single dict
+# access instead of going through the comparisons below one by one.
+# 'CRy' is left out on purpose: it contains 'Ry', so it is translated as a ry gate
+QBASE_GATE_NAMES = {
+	'I': 'id', 'id': 'id', #identity gate
+	'T': 't', 't': 't', # T gate
+	'H': 'h', 'h': 'h', # H gate
+	's': 's', 'Ph': 's', # phase gate
+	'CX': 'cx', 'cx': 'cx', 'CNOT': 'cx', # controlled not gate
+	"T^\dagger": 'tdg', 'tdg': 'tdg',
+	'sdg': 'sdg', "S^\dagger": 'sdg',
+	'X': 'x', 'x': 'x',
+	'Y': 'y', 'y': 'y',
+	'Z': 'z', 'z': 'z',
+	'cz': 'cz', 'CZ': 'cz',
+	'ch': 'ch', 'CH': 'ch',
+	'ccx': 'ccx',
+}
+
 def translate_to_QBASE(instructions):
 	translated_instructions = []
 	for command in instructions:
 		gate_name = command[0]
-		if gate_name == 'I' or gate_name == 'id': #identity gate
-			translated_instructions.append(('id', command[1], command[2]))
-		elif gate_name == 'T' or gate_name == 't': # T gate
-			translated_instructions.append(('t', command[1], command[2]))
-		elif gate_name == 'H' or gate_name == 'h': # H gate
-			translated_instructions.append(('h', command[1], command[2]))
-		elif gate_name == 's' or gate_name == 'Ph': # phase gate
-			translated_instructions.append(('s', command[1], command[2]))
-		elif gate_name == 'CX' or gate_name == 'cx' or gate_name == 'CNOT': # controlled not gate
-			translated_instructions.append(('cx', command[1], command[2]))
+		qbase_gate = QBASE_GATE_NAMES.get(gate_name)
+		if qbase_gate is not None:
+			translated_instructions.append((qbase_gate, command[1], command[2]))
 		elif 'Ry' in gate_name or 'ry' in gate_name:
 			translated_instructions.append(('ry'+gate_name[len('ry'):], command[1], command[2]))
 		elif 'Rz' in gate_name or 'rz' in gate_name:
@@ -20,18 +32,8 @@ def translate_to_QBASE(instructions):
 			translated_instructions.append(('rx'+gate_name[len('rx'):], command[1], command[2]))
 		elif gate_name.lower() == 'entangle':
 			translated_instructions.append(('entangle', command[1], command[2]))
-		elif gate_name == "T^\dagger" or gate_name == 'tdg':
-			translated_instructions.append(('tdg', command[1], command[2]))
-		elif gate_name == 'sdg' or gate_name == "S^\dagger":
-			translated_instructions.append(('sdg', command[1], command[2]))
 		elif gate_name.lower() == 'swap':
 			translated_instructions.append(('swap', command[1], command[2]))
-		elif gate_name == 'X' or gate_name == 'x':
-			translated_instructions.append(('x', command[1], command[2]))
-		elif gate_name == 'Y' or gate_name == 'y':
-			translated_instructions.append(('y', command[1], command[2]))
-		elif gate_name == 'Z' or gate_name == 'z':
-			translated_instructions.append(('z', command[1], command[2]))
 		elif gate_name.lower() == 'measure':
 			translated_instructions.append(('measure', command[1], command[2]))
 		elif gate_name.lower() == 'allocate':
@@ -48,12 +50,6 @@ def translate_to_QBASE(instructions):
 			translated_instructions.append(('u3'+gate_name[2:], command[1], command[2]))
 		elif 'cy' == gate_name or 'CRy' == gate_name:
 			translated_instructions.append(('cy', command[1], command[2]))
-		elif 'cz' == gate_name or 'CZ' == gate_name:
-			translated_instructions.append(('cz', command[1], command[2]))
-		elif 'ch' == gate_name or 'CH' == gate_name:
-			translated_instructions.append(('ch', command[1], command[2]))
-		elif 'ccx' == gate_name:
-			translated_instructions.append(('ccx', command[1], command[2]))
 		elif 'crz' in gate_name or 'CRz' in gate_name:
 			translated_instructions.append(('crz'+gate_name[3:], command[1], command[2]))
 		elif 'cu1' in gate_name:
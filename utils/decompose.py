@@ -1,10 +1,28 @@
 """ module for decomposing rotations into Clifford + T """
 
 import subprocess
+from functools import lru_cache
 
 from utils import paths
 
 
+@lru_cache(maxsize=1024)
+def run_gridsynth(angle, epsilon):
+    """ Runs the gridsynth binary for one angle and precision
+
+    gridsynth is deterministic, so the output is cached per (angle, epsilon)
+    and repeated rz angles, across circuits as well, only spawn it once.
+    The cache is bounded as the worker is long lived, and a failed run raises
+    CalledProcessError so it is never cached
+    """
+    gridsynth_loc = paths.rel_path_to_abs_path("utils/gridsynthEXE")
+    cmds = [gridsynth_loc, angle, "-e", str(epsilon)]
+    # run() reads the output while waiting and closes the pipe afterwards
+    result = subprocess.run(cmds, stdout=subprocess.PIPE, check=True)
+
+    return result.stdout.decode()
+
+
 class Decompose:
     """ Takes one unitary, and decomposes into Clifford + T
 
@@ -32,11 +50,6 @@ class Decompose:
 
         # todo: Make sure the output from ProjectQ is in radians and also,
         #  make it language dependent. Do not hardcode!
-        gridsynth_loc = paths.rel_path_to_abs_path("utils/gridsynthEXE")
         angle = list(self.unitary.split("("))[1][:-1]
-        cmds = [gridsynth_loc, angle, "-e", str(self.epsilon)]
-        popen = subprocess.Popen(cmds, stdout=subprocess.PIPE)
-        popen.wait()
-        result = popen.stdout.read()
 
-        return result.decode()
+        return run_gridsynth(angle, self.epsilon)
@@ -1,10 +1,15 @@
 """ Parsers of programs for quantum computers """
 
 import re
+import os
 import os.path as osp
 import itertools as it
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, cached_property
 
 from utils import decompose
+from utils import paths
 
 
 class Parse:
@@ -24,6 +29,10 @@ class Parse:
         "s^\\dagger": "sdg",
     }
 
+    # Below this number of unique rz gates the decompositions are run one
+    # after the other, since starting a thread pool would cost more than it saves
+    parallel_decomposition_threshold = 4
+
     def __init__(self, filepath, epsilon):
         self.filepath = filepath
         self.epsilon = epsilon
@@ -40,7 +49,7 @@ class Parse:
 
     @staticmethod
     def _get_gate_list_after_approx(gate_list, rz_approx, gate_index_lookup):
-        """Modify the original list to add in the decomposed gates...
+        """Build the gate list with the decomposed gates in place of rz gates...
 
         ...using the decomposition dictionary rz_approx
 
@@ -55,36 +64,41 @@ class Parse:
                 gate_list using indices as keys, gate as values
 
         Returns:
-            gate_list (list): The same gate_list but with rz gates decomposed
+            new_gate_list (list): A copy of gate_list with rz gates decomposed
         """
 
-        # Inserting the rz approximations from highest indices to lowest,
-        # that way, the subsequence indices won't be affected
-        for gate_index in sorted(gate_index_lookup.keys(), reverse=True):
-            # Remove original entry
-            gate_list.pop(gate_index)
+        # The same rz gate usually appears many times, reverse and clean up
+        # each approximated sequence once rather than once per occurrence
+        circuit_order_approx = {}
 
-            # This will store the gate approximation
-            gate_approx_created = []
+        # Copy the gates over in a single forward pass, expanding the rz gates
+        # as they come, instead of popping and splicing the original list
+        new_gate_list = []
+        for gate_index, gate in enumerate(gate_list):
+            if gate_index not in gate_index_lookup:
+                new_gate_list.append(gate)
+                continue
 
-            # rz_approx is a dictionary containing the rz approximation of
-            # the rz gates
-            # Operators are shown in matrix order, not circuit order.
-            # This means they are meant to be applied from right to left
-            # (hence the [::-1])
-            for g in rz_approx[gate_index_lookup[gate_index][0]][::-1]:
-                g = g.lower()
+            rz_gate, qubits = gate[0], gate[1]
 
+            approx_gates = circuit_order_approx.get(rz_gate)
+            if approx_gates is None:
+                # rz_approx is a dictionary containing the rz approximation of
+                # the rz gates
+                # Operators are shown in matrix order, not circuit order.
+                # This means they are meant to be applied from right to left
+                # (hence the reversed)
                 # Ignore new line character and omega scaler
-                if "\n" in g or "w" in g:
-                    continue
-
-                gate_approx_created.append((g, gate_index_lookup[gate_index][1]))
+                approx_gates = [
+                    g
+                    for g in map(str.lower, reversed(rz_approx[rz_gate]))
+                    if "\n" not in g and "w" not in g
+                ]
+                circuit_order_approx[rz_gate] = approx_gates
 
-            # Add new entry
-            gate_list[gate_index:gate_index] = gate_approx_created
+            new_gate_list.extend((g, qubits) for g in approx_gates)
 
-        return gate_list
+        return new_gate_list
 
     @staticmethod
     def _rz_gates_index_in_original_list(gate_list):
@@ -102,8 +116,10 @@ class Parse:
         # The indices of the rz gates will be the keys for this dictionary
         gate_index_lookup = {}
 
-        # This list will store the unique rz gates
+        # This list will store the unique rz gates, in order of appearance.
+        # The set mirrors it for constant time membership checks
         unique_rz_gates = []
+        seen_rz_gates = set()
 
         for gate_index, gate in enumerate(gate_list):
             if "rz" in gate[0]:
@@ -112,17 +128,29 @@ class Parse:
                 # The gate itself is the value
                 gate_index_lookup[gate_index] = gate
 
-                if gate[0] not in unique_rz_gates:
+                if gate[0] not in seen_rz_gates:
+                    seen_rz_gates.add(gate[0])
                     unique_rz_gates.append(gate[0])
 
         return gate_index_lookup, unique_rz_gates
 
+    def _decompose_rz_gate(self, rz_gate):
+        """Decompose a single rz gate into Clifford + T using gridsynth
+        Args:
+            rz_gate (str): the rz gate to decompose, i.e. rz(0.1452345)
+        Returns:
+            str: the decomposed operators returned by gridsynth
+        """
+        return decompose.Decompose(rz_gate, self.epsilon).operators
+
     def perform_rz_decomposition(self, gate_list):
         """Decompose the rz gates
         Args:
             gate_list (list): the original list of gates with rz gates
         Returns:
-            gate_list (list): The same gate_list but with rz gates decomposed
+            gate_list (list): A new list with the rz gates decomposed, the
+                input gate_list is not modified (and is returned as is when it
+                has no rz gates)
         """
 
         # Pre process the gates
@@ -136,17 +164,18 @@ class Parse:
             # Dictionary will contain the decomposed rz gates
             # i.e. rz(0.1452345):HTHTHTHTHTHT
             #       (just an example, not actual decomposition)
-            rz_approx = {}
-
-            for rz_gate in unique_rz_gates:
-                # Do the decomposition
-                decom = decompose.Decompose(rz_gate, self.epsilon)
-
-                # Save the decomposition in dictionary
-                rz_approx[rz_gate] = decom.operators
+            if len(unique_rz_gates) < self.parallel_decomposition_threshold:
+                operators = map(self._decompose_rz_gate, unique_rz_gates)
+                rz_approx = dict(zip(unique_rz_gates, operators))
+            else:
+                # Every decomposition runs in its own gridsynth process,
+                # so threads are enough to run them concurrently
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    operators = executor.map(self._decompose_rz_gate, unique_rz_gates)
+                    rz_approx = dict(zip(unique_rz_gates, operators))
 
             # Using the decomposition dictionary rz_approx,
-            # modify the original list to add in the decomposed gates
+            # build a new list with the decomposed gates in place of the rz gates
             gate_list = self._get_gate_list_after_approx(
                 gate_list, rz_approx, gate_index_lookup
             )
@@ -154,6 +183,16 @@ class Parse:
         return gate_list
 
 
+@lru_cache(maxsize=32)
+def _read_in_library(lib_path, mtime):
+    """Read in an included library file, cached since the same headers
+    (i.e. qelib1.inc) are included by every qasm file.
+    The modification time is part of the key, so an edited library is read
+    in again. The result is immutable as it is shared between callers.
+    """
+    return tuple(tuple(words) for words in Parse.read_in_file(lib_path))
+
+
 # noinspection PyPep8Naming
 class ParseQasm(Parse):
     """A parser for quantum programs in .qasm format"""
@@ -169,6 +208,14 @@ class ParseQasm(Parse):
         self.gate_count_decomp = 0
         self.instructions, self.num_qubits = self.get_gate_list()
 
+    @staticmethod
+    def read_in_library(lib_path):
+        """Same as read_in_file, but reuses the previous read of the library
+        while the file is unchanged
+        """
+        cached = _read_in_library(lib_path, osp.getmtime(lib_path))
+        return [list(words) for words in cached]
+
     def entire_list(self) -> list:
         """Combine all code, including imported libraries, into one list
 
@@ -192,18 +239,17 @@ class ParseQasm(Parse):
             if line[0] == "include":  # if line is a header
                 name = line[1].strip(";")
                 lib_name = name.replace('"', "", 2)
-                path_to_root_dir = osp.dirname(osp.dirname(osp.realpath(__file__)))
-                lib_path = f"{path_to_root_dir}/src/transpiler/{lib_name}"
+                lib_path = paths.rel_path_to_abs_path(f"src/transpiler/{lib_name}")
 
                 # gets into the header file and turns it into a list
-                lib_list = self.read_in_file(lib_path)
+                lib_list = self.read_in_library(lib_path)
 
                 library.append(lib_list)
 
         # To unpack the list of library.
         # Only useful when there are multiple "include"s
         for lib in library:
-            unpack_lib = unpack_lib + lib
+            unpack_lib.extend(lib)
 
         # returns a list with the contents of the header files and the qasm_list
         whole_file = unpack_lib + qasm_list
@@ -404,13 +450,12 @@ class ParseQasm(Parse):
                             simplified_exp = eval(exp)
                             simplified_expression_list.append(simplified_exp)
 
-                        final_name = cur_gate + "("
-                        for count, param in enumerate(simplified_expression_list):
-                            if count == len(simplified_expression_list) - 1:
-                                final_name += str(param)
-                            else:
-                                final_name += str(param) + ","
-                        final_name += ")"
+                        final_name = (
+                            cur_gate
+                            + "("
+                            + ",".join(map(str, simplified_expression_list))
+                            + ")"
+                        )
                         gate_name.append(final_name)
                     except BaseException as e:
                         # todo Catch the intended exception type here, only
@@ -553,9 +598,11 @@ class ParseQasm(Parse):
         """
 
         # Extract (into a list of lists) the numbers from strings like 'q[3]'
+        # by slicing between the brackets, which is much cheaper than a regex
         # pylint: disable=invalid-name
         qubit_IDs = [
-            [int(re.findall(r"\d+", q)[0]) for q in name] for name in qubit_names
+            [int(q[q.index("[") + 1 : q.index("]")]) for q in name]
+            for name in qubit_names
         ]
 
         # Determine how to re-number qubits so they are consecutive,
@@ -607,9 +654,11 @@ class ParseProjectQ(Parse):
         # could include all qubits used if not recycling ancilla
         return self.max_width
 
-    @property
+    @cached_property
     def instructions(self):
         # a list of list of list
+        # Cached: breaking into sections re-reads the file, decomposes the rz
+        # gates and adds to gate_count, so it must only run once
         return self.break_into_sections()
 
     def process_input(self, file_path):
@@ -651,6 +700,8 @@ class ParseProjectQ(Parse):
         # gate_name: e.g, X or H
         # qubit_involved: qubits the gate is acting on. e.g, [1]
 
+        translate_dict = self.translate_dict
+
         with open(file_path, "r") as f:
             for line in f:
                 if line[:2] == "<p":
@@ -664,9 +715,10 @@ class ParseProjectQ(Parse):
                     # convert qubit numbers to int
                     qubit_int = [int(ele) for ele in re.findall(r"\b\d+\b", qubit_str)]
 
-                    if gate_name in super().translate_dict.keys():
-                        # translate into the standard internal convention
-                        gate_name = super().translate_dict[gate_name]
+                    # translate into the standard internal convention
+                    translated_name = translate_dict.get(gate_name)
+                    if translated_name is not None:
+                        gate_name = translated_name
                     elif gate_name == "allocate":
                         num_active_qubits += 1
                     elif gate_name == "deallocate":
@@ -677,8 +729,9 @@ class ParseProjectQ(Parse):
                         # take care of the special case of "input measure ...".
                         # ProjectQ appends a gate after this line
                         gate_name = gate_name.split(":")[-1].strip()
-                        if gate_name in super().translate_dict.keys():
-                            gate_name = super().translate_dict[gate_name]
+                        translated_name = translate_dict.get(gate_name)
+                        if translated_name is not None:
+                            gate_name = translated_name
                         elif gate_name == "measure":
                             data_qubits.extend(qubit_int)
                         elif gate_name == "allocate":
@@ -754,6 +807,11 @@ class ParseProjectQ(Parse):
         # ancillas will always use either 3 or 4 as qubit_ID
         ancilla_reg = [False] * (self.max_width - len(data_qubits))
 
+        # free_ancillas is a min-heap of ancilla_reg indices that may be free,
+        # so the lowest free spot is found without scanning ancilla_reg.
+        # Spots taken on first use stay in the heap and are skipped lazily
+        free_ancillas = list(range(len(ancilla_reg)))
+
         # name_change is a dictionary to keep track of ancilla qubits whose ID
         # has been reassigned using ancilla_reg index
         # e.g., using the previous example, if ancillas are re-used and
@@ -765,7 +823,10 @@ class ParseProjectQ(Parse):
         name_change = {}
 
         # measured_qubit keeps track of which qubits have been measured
-        measured_qubit = []
+        measured_qubit = set()
+
+        # set of the data qubits, for constant time membership checks
+        data_qubit_set = set(data_qubits)
 
         # the max numerical ID of the data qubits.
         # e.g., data_qubits is [0, 1, 2] and the max_dataID will be 2
@@ -790,7 +851,7 @@ class ParseProjectQ(Parse):
 
                 # Then process the qubit ID
                 q = qubit[0]
-                if q not in data_qubits:
+                if q not in data_qubit_set:
                     # this is an ancilla
                     if q < self.max_width:
                         # first time using this ancilla
@@ -798,8 +859,9 @@ class ParseProjectQ(Parse):
                     else:
                         # Need to find an available ancilla spot
                         # and change the qubit ID
-                        for j, value in enumerate(ancilla_reg):
-                            if value is False:
+                        while free_ancillas:
+                            j = heapq.heappop(free_ancillas)
+                            if ancilla_reg[j] is False:
                                 # this ancilla spot is free to be assigned
                                 ancilla_reg[j] = True
 
@@ -819,17 +881,18 @@ class ParseProjectQ(Parse):
                 # all de-allocation is done by measuring the qubit out
                 gate = "measure"
 
-                if q not in data_qubits:
+                if q not in data_qubit_set:
                     if q in name_change.keys():
                         # change it to be the ancilla ID
                         qubit = [name_change[q]]
                         q = qubit[0]
                     # Release this ancilla so it can be re-allocated again later
                     ancilla_reg[q - max_dataID - 1] = False
+                    heapq.heappush(free_ancillas, q - max_dataID - 1)
 
                 # keep track of measured out qubits in case there are
                 # classically controlled gates occurring after the measurement
-                measured_qubit.append(q)
+                measured_qubit.add(q)
 
                 if result[index] == []:
                     try:
@@ -851,7 +914,7 @@ class ParseProjectQ(Parse):
                 #     index += 1
 
             elif gate == "measure":
-                measured_qubit.append(qubit[0])
+                measured_qubit.add(qubit[0])
 
                 if qubit[0] in name_change:
                     qubit[0] = name_change[qubit[0]]
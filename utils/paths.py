@@ -1,20 +1,14 @@
 """ Utils module for manipulating paths within this package """
 
 import os.path as osp
-import re
+
+# Absolute path to the root of this package, i.e. the parent of utils/.
+# Resolved once at import instead of on every path lookup
+REPO_ROOT_DIR = osp.dirname(osp.dirname(osp.realpath(__file__)))
 
 
 def rel_path_to_abs_path(rel_path: str) -> str:
-    full_file_path = osp.realpath(__file__)
-    last_known_bit_of_path = "utils/paths.py"
-    new_path, n_subs = re.subn(
-        rf"/{last_known_bit_of_path}.*",
-        rf"/{rel_path}",
-        full_file_path,
-        flags=re.MULTILINE | re.DOTALL,
-    )
-    assert n_subs == 1
-    return new_path
+    return f"{REPO_ROOT_DIR}/{rel_path}"
 
 
 def get_abs_path_to_input_file(filename: str) -> str:
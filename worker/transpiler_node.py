@@ -13,10 +13,12 @@ from logger.redis_logger import RedisHandler
 
 # Load configs
 config = configparser.ConfigParser()
-config.read_file(open("/app/config/server.conf"))
+with open("/app/config/server.conf") as config_file:
+    config.read_file(config_file)
 use_database = config.getboolean("Database", "use_database")
 db_table_name = config["Database"]["db_table_name"]
 database_host = config["Database"]["host"]
+database_max_retries = config.getint("Database", "max_retries", fallback=3)
 
 # Setup Logger
 is_slack_enabled = config.getboolean("Logger", "slack_logging_enabled")
@@ -32,6 +34,30 @@ ttl_seconds = config["Redis"]["ttl_seconds"]
 # Create a global Redis instance
 redis = Redis(host=redis_host, port=redis_port)
 timeout_interval = config["TranspilerNode"]["timeout_interval"]
+output_path = config["TranspilerNode"]["output_path"]
+optimizer_executable = config["Optimizer"]["executable"]
+
+# One database client per process, so its session keeps reusing connections
+database_client = (
+    DatabaseClient(database_host, database_max_retries) if use_database else None
+)
+
+# The executing status message is the same for every request, serialize it once
+executing_status_message = json.dumps({"status": StatusEnum.executing})
+
+
+def replace_status_message(topic, status_message):
+    """
+    Replace the status message stored in a get_request topic.
+
+    Args:
+        topic (str): The get_request topic of the request.
+        status_message (str): The serialized status message to store.
+    """
+    redis.rpush(topic, status_message)
+    if redis.llen(topic) > 1:
+        # Remove the previous status message
+        redis.lpop(topic)
 
 
 def transpiler_function(message):
@@ -53,8 +79,6 @@ def transpiler_function(message):
         epsilon = message["epsilon"]
         bypass_optimization = message["bypass_optimization"]
         request_id = message["request_id"]
-        output_path = config["TranspilerNode"]["output_path"]
-        optimizer_executable = config["Optimizer"]["executable"]
 
         # Get the base name of the file (including the extension)
         file_name_with_extension = os.path.basename(file_path)
@@ -84,11 +108,7 @@ def transpiler_function(message):
 
         # Update the status to excuting in get_request topic
         try:
-            status_message = json.dumps({"status": StatusEnum.executing})
-            redis.rpush(topic, status_message)
-            if redis.llen(topic) > 1:
-                # Remove the previous status message
-                redis.lpop(topic)
+            replace_status_message(topic, executing_status_message)
             logger.debug("Successfully updated status to executing.")
         except Exception as e:
             err_msg = f"""The status update for the get_request topic with ID {request_id}
@@ -100,7 +120,6 @@ def transpiler_function(message):
             logger.info(f"Updating database entry with id: {request_id}")
             try:
                 # Update entry in Database
-                database_client = DatabaseClient(database_host)
                 put_body = {"entry_id": request_id,"update_data": {"status": StatusEnum.executing}, "table": db_table_name}
 
                 # Send request
@@ -166,10 +185,7 @@ def transpiler_function(message):
             # Serialize report content into a JSON string
             serialized_report_string = json.dumps(report_message)
             # Update the result and status in get_request topic
-            redis.rpush(topic, serialized_report_string)
-            if redis.llen(topic) > 1:
-                # Remove the previous status message
-                redis.lpop(topic)
+            replace_status_message(topic, serialized_report_string)
             logger.debug(
                 "Successfully updated result and status to done/failed in get request topic."
             )
@@ -208,12 +224,13 @@ if __name__ == "__main__":
 
     while True:
         try:
-            msg = redis.lpop(request_topic)
-            if msg:
+            # Block until a request arrives instead of polling and sleeping,
+            # timing out every timeout_interval seconds to keep the loop alive
+            popped = redis.blpop(request_topic, timeout=int(timeout_interval))
+            if popped:
+                _, msg = popped
                 logger.info("Redis Msg received")
                 transpiler_function(json.loads(msg))
-            else:
-                time.sleep(int(timeout_interval))
         except Exception as e:
             logger.error(e)
             continue